@@ -3,22 +3,29 @@
 TelePrompter — Professional Teleprompter Application
 Author  : 𝓐.𝓒.𝓑
 Requires: pip install PyQt5
-Optional: pip install keyboard sounddevice numpy PyMuPDF
+Optional: pip install keyboard sounddevice numpy PyMuPDF numba charset-normalizer
 """
 
 # ── Standard library ──────────────────────────────────────────────────────────
-import sys, json, re
+import sys, os, json, re, io
+from collections import OrderedDict
 from pathlib import Path
 
 # ── PyQt5 ─────────────────────────────────────────────────────────────────────
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QTextEdit, QPushButton, QSlider, QCheckBox, QGroupBox,
+    QLabel, QTextEdit, QPlainTextEdit, QPushButton, QSlider, QCheckBox, QGroupBox,
     QFileDialog, QColorDialog, QComboBox, QFontComboBox, QInputDialog,
     QProgressBar, QTabWidget, QSpinBox, QMessageBox, QSizeGrip,
 )
-from PyQt5.QtCore  import Qt, QTimer, QElapsedTimer
-from PyQt5.QtGui   import QPainter, QFont, QFontMetrics, QColor, QPen, QPalette
+from PyQt5.QtCore  import (
+    Qt, QTimer, QElapsedTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    pyqtSlot, QMetaObject, QPointF, QStringListModel,
+)
+from PyQt5.QtGui   import (
+    QPainter, QFont, QFontMetrics, QColor, QPen, QPalette, qRgba, QTextLayout,
+    QStaticText, QTransform,
+)
 
 try:
     from PyQt5.QtPrintSupport import QPrinter
@@ -28,11 +35,15 @@ except ImportError:
 
 # ── Optional extras ───────────────────────────────────────────────────────────
 try:
-    import sounddevice as _sd
     import numpy as _np
-    MIC_OK = True
 except ImportError:
-    _sd = _np = None
+    _np = None
+
+try:
+    import sounddevice as _sd
+    MIC_OK = _np is not None
+except ImportError:
+    _sd = None
     MIC_OK = False
 
 try:
@@ -49,6 +60,18 @@ except ImportError:
     _fitz = None
     PYMUPDF_OK = False
 
+try:
+    from numba import njit as _njit   # optional JIT for the paint hot loop
+    NUMBA_OK = _np is not None
+except ImportError:
+    _njit = None
+    NUMBA_OK = False
+
+try:
+    import charset_normalizer as _csn   # optional — one-pass encoding detection
+except ImportError:
+    _csn = None
+
 # ── Windows taskbar icon fix ──────────────────────────────────────────────────
 try:
     import ctypes
@@ -69,6 +92,29 @@ _ENCODINGS = ['utf-8-sig', 'utf-8', 'cp1254', 'cp1252', 'cp1250', 'latin-1']
 # Alpha fade lookup table: dist (0..511) → alpha (0..255)
 # Formula: max(0, 255 - int(dist * 0.75))   clipped at 340 → 0
 _ALPHA_LUT: list[int] = [max(0, 255 - int(d * 0.75)) for d in range(512)]
+_FADE_RANGE = 340   # dist at which the LUT reaches 0 — nothing paints past it
+
+# NumPy copy for vectorized paint-loop gathers (None when numpy absent)
+_ALPHA_LUT_NP = _np.asarray(_ALPHA_LUT, dtype=_np.uint8) if _np is not None else None
+
+if NUMBA_OK:
+    @_njit(cache=True)
+    def _line_visuals(first_i: int, last_i: int, start_y: int, lh: int,
+                      asc: int, focus_y: int, lut):
+        """Baseline y + fade alpha for lines first_i..last_i (JIT-compiled)."""
+        n      = last_i - first_i
+        ays    = _np.empty(n, _np.int32)
+        alphas = _np.empty(n, _np.int32)
+        for k in range(n):
+            ay = start_y + (first_i + k) * lh + asc
+            d  = ay - focus_y
+            if d < 0:   d = -d
+            if d > 511: d = 511
+            ays[k]    = ay
+            alphas[k] = lut[d]
+        return ays, alphas
+else:
+    _line_visuals = None
 
 # ── Themes ────────────────────────────────────────────────────────────────────
 THEMES: dict[str, dict] = {
@@ -91,9 +137,13 @@ def _load_save() -> dict:
     return {"slots": {}, "last_text": ""}
 
 def _write_save(data: dict) -> None:
-    SAVE_FILE.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8'
+    # Write to a sibling temp file and atomically swap it in — a crash mid-
+    # write can no longer truncate the save file
+    tmp = SAVE_FILE.with_suffix('.json.tmp')
+    tmp.write_bytes(
+        json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
     )
+    os.replace(tmp, SAVE_FILE)
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  File helpers
@@ -113,15 +163,47 @@ def _read_text_file(path: str) -> tuple[str, str | None]:
                 "Install with:  pip install PyMuPDF"
             )
         try:
-            doc   = _fitz.open(str(p))
-            pages = [page.get_text() for page in doc]
+            doc = _fitz.open(str(p))
+            # Stream pages into one buffer — no list of page strings plus a
+            # join copy, so peak memory stays ~1× the final text size.
+            buf   = io.StringIO()
+            first = True
+            for page in doc:
+                if not first:
+                    buf.write('\n\n')
+                # "text" mode skips PyMuPDF's rich reconstruction path —
+                # roughly 2× faster when only plain text is wanted
+                buf.write(page.get_text("text"))
+                first = False
             doc.close()
-            return '\n\n'.join(pages).strip(), None
+            return buf.getvalue().strip(), None
         except Exception as exc:
             return '', f"Could not read PDF:\n{exc}"
 
     # ── Plain text with encoding probe ────────────────────────────────────────
     raw = p.read_bytes()
+    # Strict UTF-8 first: it is the overwhelmingly common case, a valid UTF-8
+    # file can never be mojibake under this decode, and utf-8-sig strips the
+    # BOM Windows Notepad prepends (the detector reports plain utf_8 for
+    # those files and would leave a stray ﻿ in the script).
+    try:
+        return raw.decode('utf-8-sig'), None
+    except UnicodeDecodeError:
+        pass
+    # Detector only for the multi-byte UTF families the probe list omits
+    # (UTF-16/32). Single-byte guesses are ignored: the detector routinely
+    # mislabels cp1252/cp1254 text as a sibling codepage, every byte still
+    # decodes, and the result is silent mojibake — the ordered probe list
+    # below handles those deliberately (cp1254 first; the app targets
+    # Turkish users).
+    if _csn is not None:
+        guess = _csn.from_bytes(raw[:65536]).best()
+        if guess is not None and (
+                guess.bom or guess.encoding.startswith(('utf_16', 'utf_32'))):
+            try:
+                return raw.decode(guess.encoding), None
+            except (UnicodeDecodeError, LookupError):
+                pass   # mis-detection — fall through to the probe list
     for enc in _ENCODINGS:
         try:
             return raw.decode(enc), None
@@ -132,6 +214,144 @@ def _read_text_file(path: str) -> tuple[str, str | None]:
         "Please save the file as UTF-8 and try again."
     )
 
+class _SaveWorker(QRunnable):
+    """Writes a snapshot of the save data off the UI thread — disk flushes
+    must not stall the panel (or playback) on slot save/delete."""
+    def __init__(self, data: dict):
+        super().__init__()
+        self._data = data
+
+    def run(self):
+        try:
+            _write_save(self._data)
+        except Exception as exc:
+            print(f"[Save] {exc}")
+
+# Saves get their own single-thread pool: every snapshot shares the one
+# temp path in _write_save, so two workers on the global pool could
+# interleave write_bytes and os.replace a half-written blob into the save
+# file. One thread serializes the writes and keeps last-save-wins order.
+_SAVE_POOL = QThreadPool()
+_SAVE_POOL.setMaxThreadCount(1)
+
+class _LoadSignals(QObject):
+    done = pyqtSignal(str, object)    # (text, error_msg | None)
+
+class _LoadWorker(QRunnable):
+    """Runs _read_text_file off the UI thread — PDF extraction can block
+    for seconds on large documents."""
+    def __init__(self, path: str):
+        super().__init__()
+        self.path    = path
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            text, err = _read_text_file(self.path)
+        except Exception as exc:       # e.g. OSError — file vanished mid-read
+            text, err = '', str(exc)
+        self.signals.done.emit(text, err)
+
+def _render_pdf(path: str, text: str):
+    """Render *text* to a PDF at *path*. Returns an error message or None.
+
+    Pure rendering — no widgets touched, so it is safe to run on a pool
+    thread (QPrinter + QPainter work off the GUI thread as long as they
+    are created and destroyed on the same thread)."""
+    printer = QPrinter(QPrinter.HighResolution)
+    printer.setOutputFormat(QPrinter.PdfFormat)
+    printer.setOutputFileName(path)
+    pnt = QPainter()
+    if not pnt.begin(printer):
+        return "Could not create PDF."
+
+    PW, PH  = printer.width(), printer.height()
+    marg    = int(PW * 0.09)
+    mw      = PW - 2 * marg
+    # Metrics must be taken against the printer — a HighResolution page is
+    # ~1200 dpi, and screen-DPI metrics would draw microscopic text
+    bf      = QFont("Arial", 36); bfm = QFontMetrics(bf, printer)
+    lh      = bfm.lineSpacing() + 10
+    tf      = QFont("Arial", 52, QFont.Bold); tfm = QFontMetrics(tf, printer)
+    y       = marg
+
+    pnt.setFont(tf); pnt.setPen(QColor(30, 30, 30))
+    pnt.drawText(marg, y + tfm.ascent(), "Script")
+    y += tfm.lineSpacing() + lh // 2
+    pnt.setPen(QPen(QColor(120, 120, 120), 2))
+    pnt.drawLine(marg, y, PW - marg, y); y += lh
+
+    pnt.setFont(bf)
+    clean = _NOTE_RE.sub('', text)
+
+    # Loop-invariant paint objects — QFont construction in particular
+    # goes through font matching and must stay out of the paragraph loop
+    pause_font = QFont("Arial", 24); pause_fm = QFontMetrics(pause_font, printer)
+    pause_pen  = QPen(QColor(200, 100, 0), 1, Qt.DashLine)
+    pause_col  = QColor(200, 100, 0)
+    body_col   = QColor(20, 20, 20)
+    # Shape the repeated pause label once — drawStaticText reuses the
+    # cached glyph layout for every occurrence
+    pause_st   = QStaticText("⏸ PAUSE")
+    pause_st.prepare(QTransform(), pause_font)
+
+    for raw in clean.splitlines():
+        para = raw.strip()
+        if not para:
+            y += lh // 2; continue
+        if y + lh * 2 > PH - marg: printer.newPage(); y = marg
+
+        if para == _PAUSE_TAG:
+            mid = y + lh // 2
+            pnt.setPen(pause_pen)
+            pnt.drawLine(marg, mid, PW - marg, mid)
+            pnt.setFont(pause_font); pnt.setPen(pause_col)
+            pnt.drawStaticText(PW // 2 - 38, mid - pause_fm.ascent() // 2,
+                               pause_st)
+            pnt.setFont(bf); y += lh; continue
+
+        # QTextLayout shapes + wraps the whole paragraph once in C++,
+        # replacing the Python greedy wrap and per-line drawText re-shaping
+        lay = QTextLayout(para, bf, printer)
+        lay.beginLayout()
+        tls = []
+        while True:
+            tl = lay.createLine()
+            if not tl.isValid():
+                break
+            tl.setLineWidth(mw)
+            tl.setPosition(QPointF(0, 0))
+            tls.append(tl)
+        lay.endLayout()
+
+        pnt.setPen(body_col)
+        for tl in tls:
+            if y + tl.height() > PH - marg: printer.newPage(); y = marg
+            tl.draw(pnt, QPointF(marg, y))
+            y += int(tl.height()) + (lh - bfm.lineSpacing())
+
+    pnt.end()
+    return None
+
+class _ExportSignals(QObject):
+    done = pyqtSignal(str, object)    # (path, error_msg | None)
+
+class _ExportWorker(QRunnable):
+    """Runs _render_pdf off the UI thread — rendering a long script to
+    PDF can take seconds and would otherwise freeze the panel."""
+    def __init__(self, path: str, text: str):
+        super().__init__()
+        self.path    = path
+        self.text    = text
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            err = _render_pdf(self.path, self.text)
+        except Exception as exc:
+            err = str(exc)
+        self.signals.done.emit(self.path, err)
+
 def _line_x(line_w: int, align: int, win_w: int, margin: int = 40) -> int:
     """Compute left x for a line given alignment — inlined for speed."""
     if   align == Qt.AlignHCenter: return max(0, (win_w - line_w) >> 1)
@@ -141,15 +361,16 @@ def _line_x(line_w: int, align: int, win_w: int, margin: int = 40) -> int:
 # ─────────────────────────────────────────────────────────────────────────────
 #  Word x-position helper  (pure function, called only on cache miss)
 # ─────────────────────────────────────────────────────────────────────────────
-def _word_xs(words: list[str], fm: QFontMetrics,
-             sp_w: int, align: int, win_w: int) -> list[tuple[str, int]]:
-    total = sum(fm.horizontalAdvance(w) for w in words) + sp_w * (len(words) - 1)
-    x0    = _line_x(total, align, win_w)
-    out, x = [], x0
-    for w in words:
-        out.append((w, x))
-        x += fm.horizontalAdvance(w) + sp_w
-    return out
+def _word_xs(words: list[str], adv,
+             sp_w: int, align: int, win_w: int):
+    """x position per word — int32 array when numpy is available (SoA)."""
+    widths = [adv(w) for w in words]   # measure once, reuse for total and xs
+    total  = sum(widths) + sp_w * (len(words) - 1)
+    xs, x  = [], _line_x(total, align, win_w)
+    for ww in widths:
+        xs.append(x)
+        x += ww + sp_w
+    return xs if _np is None else _np.asarray(xs, dtype=_np.int32)
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  Presenter Notes Window
@@ -214,6 +435,10 @@ class NotesWindow(QWidget):
 # ══════════════════════════════════════════════════════════════════════════════
 class TeleprompterWindow(QWidget):
 
+    # Word-width LRU bound — big enough for >99% hits on real scripts (word
+    # frequency is Zipfian) while keeping RSS flat over long sessions
+    WORD_CACHE_MAX = 4096
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TelePrompter")
@@ -224,7 +449,10 @@ class TeleprompterWindow(QWidget):
 
         # ── Playback state ────────────────────────────────────────────────────
         self.text           : str   = ""
+        self._word_count    : int   = 0     # cached — recomputed in set_text only
         self.scroll_y       : float = 0.0
+        self._scroll_q8     : int   = 0     # scroll offset in 1/256 px — the
+                                            # focus-line math stays all-integer
         self.is_playing     : bool  = False
         self.speed          : float = 2.0   # logical px per 16.667 ms (60 fps unit)
 
@@ -269,10 +497,18 @@ class TeleprompterWindow(QWidget):
         self._f_line_h   : int          = 1
         self._f_sp_w     : int          = 8
 
+        # Word-width memo — words repeat heavily in natural scripts, and
+        # horizontalAdvance goes through HarfBuzz shaping on every call.
+        # LRU-bounded to WORD_CACHE_MAX; cleared when the font key changes.
+        self._adv_cache  : OrderedDict[str, int] = OrderedDict()
+
         # Layout cache — rebuilt when text / width / font / align changes
         self._layout_key : tuple        = ()
         self._l_lines    : list[str]    = []
-        self._l_word_xs  : list         = []
+        self._l_words    : list[list[str]] = []   # SoA: words per line …
+        self._l_xs       : list         = []      # … and their x positions
+        self._l_line_w   : list[int]    = []
+        self._l_line_x   : list[int]    = []
         self._l_pause    : set          = set()
         self._l_notes    : dict         = {}
         self._l_total    : float        = 0.0
@@ -288,6 +524,10 @@ class TeleprompterWindow(QWidget):
         # Progress throttle
         self._prog_frame : int = 0
 
+        # When True, update() is a no-op — lets compound setting changes
+        # (e.g. a theme switch) end in exactly one repaint
+        self._suspend_updates : bool = False
+
         # Focus-line tracking (for PAUSE + notes)
         self._last_fl : int = -1
 
@@ -319,6 +559,20 @@ class TeleprompterWindow(QWidget):
         c = QColor(self.bg_color)
         c.setAlphaF(self.bg_opacity)
         self._c_bg = c
+        # Alpha-indexed palettes — the paint loop indexes these instead of
+        # allocating fresh QColors/QPens per visible line per frame. Built
+        # from packed ARGB ints so per-frame channel math drops out entirely.
+        tc = self.text_color
+        r, g, b = tc.red(), tc.green(), tc.blue()
+        hl = self._c_highlight
+        hr, hg, hb = hl.red(), hl.green(), hl.blue()
+        from_rgba = QColor.fromRgba
+        self._text_palette   = [from_rgba(qRgba(r, g, b, a)) for a in range(256)]
+        self._shadow_palette = [from_rgba(qRgba(0, 0, 0, a)) for a in range(256)]
+        self._hl_palette     = [from_rgba(qRgba(hr, hg, hb, a)) for a in range(256)]
+        self._pause_pens     = [QPen(from_rgba(qRgba(255, 140, 0, a)), 1, Qt.DashLine)
+                                for a in range(256)]
+        self._pause_palette  = [from_rgba(qRgba(255, 165, 0, a)) for a in range(256)]
 
     # ── Font + metric cache ───────────────────────────────────────────────────
     def _ensure_font(self) -> None:
@@ -326,7 +580,11 @@ class TeleprompterWindow(QWidget):
         if key == self._font_key:
             return
         f  = QFont(self.font_family, self.font_size, QFont.Bold)
-        fm = QFontMetrics(f)
+        # Set the font on the widget and reuse its shared metrics — avoids a
+        # fresh QFontMetrics engine allocation and keeps DPI consistent with
+        # the paint device
+        self.setFont(f)
+        fm = self.fontMetrics()
         lh = max(1, int(fm.lineSpacing() * self.line_spacing_factor))
         self._f_font   = f
         self._f_fm     = fm
@@ -334,7 +592,20 @@ class TeleprompterWindow(QWidget):
         self._f_line_h = lh
         self._f_sp_w   = fm.horizontalAdvance(' ')
         self._font_key = key
-        self._layout_key = ()   # font changed → layout invalid
+        self._adv_cache.clear()   # widths measured with the old font are stale
+        self._layout_key = ()     # font changed → layout invalid
+
+    def _adv(self, word: str) -> int:
+        """Word advance via the LRU memo — shapes each word at most once."""
+        cache = self._adv_cache
+        ww = cache.get(word)
+        if ww is not None:
+            cache.move_to_end(word)
+            return ww
+        ww = cache[word] = self._f_fm.horizontalAdvance(word)
+        if len(cache) > self.WORD_CACHE_MAX:
+            cache.popitem(last=False)
+        return ww
 
     # ── Layout cache ──────────────────────────────────────────────────────────
     def _ensure_layout(self) -> None:
@@ -344,50 +615,74 @@ class TeleprompterWindow(QWidget):
         if key == self._layout_key:
             return
 
-        fm    = self._f_fm
         sp_w  = self._f_sp_w
         lh    = self._f_line_h
         align = self.text_align
         mw    = W - 80
+        adv   = self._adv
 
         lines : list[str]  = []
-        wxs   : list       = []
+        words_: list       = []   # SoA: per-line word lists
+        xs_   : list       = []   # SoA: per-line x positions
+        lws   : list[int]  = []   # full-line pixel widths
+        lxs   : list[int]  = []   # precomputed left x per line
         pauses: set        = set()
         notes : dict       = {}
 
+        # Single regex pass per line: the sub callback captures the first note
+        # while stripping all of them (was a search + a sub — two full scans).
+        note_cell: list = [None]
+        def _cap_note(m, _cell=note_cell):
+            if _cell[0] is None:
+                _cell[0] = m.group(1).strip()
+            return ''
+
         for raw in self.text.split('\n'):
-            nm   = _NOTE_RE.search(raw)
-            note = nm.group(1).strip() if nm else None
-            para = _NOTE_RE.sub('', raw).strip()
+            if '[[' in raw:                            # cheap guard — notes are rare
+                note_cell[0] = None
+                para = _NOTE_RE.sub(_cap_note, raw).strip()
+                note = note_cell[0]
+            else:
+                para = raw.strip()
+                note = None
             fi   = len(lines)                          # first line index for this para
 
             if not para:
-                lines.append(''); wxs.append([])
+                lines.append(''); words_.append([]); xs_.append([])
+                lws.append(0); lxs.append(0)
             elif para == _PAUSE_TAG:
                 pauses.add(len(lines))
-                lines.append(_PAUSE_TAG); wxs.append([])
+                lines.append(_PAUSE_TAG); words_.append([]); xs_.append([])
+                lws.append(0); lxs.append(0)
             else:
                 cur_w  = 0
                 cur_ws : list[str] = []
                 for word in para.split():
-                    ww     = fm.horizontalAdvance(word)
+                    ww     = adv(word)
                     needed = ww if not cur_ws else sp_w + ww
                     if cur_w + needed <= mw:
                         cur_ws.append(word); cur_w += needed
                     else:
                         if cur_ws:
                             lines.append(' '.join(cur_ws))
-                            wxs.append(_word_xs(cur_ws, fm, sp_w, align, W))
+                            words_.append(cur_ws)
+                            xs_.append(_word_xs(cur_ws, adv, sp_w, align, W))
+                            lws.append(cur_w); lxs.append(_line_x(cur_w, align, W))
                         cur_ws, cur_w = [word], ww
                 if cur_ws:
                     lines.append(' '.join(cur_ws))
-                    wxs.append(_word_xs(cur_ws, fm, sp_w, align, W))
+                    words_.append(cur_ws)
+                    xs_.append(_word_xs(cur_ws, adv, sp_w, align, W))
+                    lws.append(cur_w); lxs.append(_line_x(cur_w, align, W))
 
             if note is not None:
                 notes[fi] = note
 
         self._l_lines    = lines
-        self._l_word_xs  = wxs
+        self._l_words    = words_
+        self._l_xs       = xs_
+        self._l_line_w   = lws
+        self._l_line_x   = lxs
         self._l_pause    = pauses
         self._l_notes    = notes
         self._l_total    = float(len(lines) * lh)
@@ -396,6 +691,11 @@ class TeleprompterWindow(QWidget):
         # Refresh notes window
         self.notes_window.set_all(notes, lines)
 
+    def update(self, *args) -> None:
+        if self._suspend_updates:
+            return
+        super().update(*args)
+
     def invalidate_layout(self) -> None:
         """Call after any setting that affects font or line layout."""
         self._font_key   = ()
@@ -448,12 +748,19 @@ class TeleprompterWindow(QWidget):
         self.speed = max(self.speed - 0.5, 0.5)
         if self._panel_sync: self._panel_sync()
 
+    def _set_scroll(self, y: float) -> None:
+        """Keep the float mirror and the Q8 integer counter in sync."""
+        self.scroll_y   = y
+        self._scroll_q8 = int(y * 256)
+
     # ── Public API ────────────────────────────────────────────────────────────
     def set_text(self, text: str) -> None:
-        self.text = text; self.scroll_y = 0.0
+        self.text = text; self._set_scroll(0.0)
+        self._word_count = sum(1 for w in text.split() if '[' not in w)
         self._layout_key = ()
         self.update()
 
+    @pyqtSlot()
     def toggle_play(self) -> None:
         if self._cd_val is not None:
             self._cd_timer.stop(); self._cd_val = None
@@ -465,9 +772,10 @@ class TeleprompterWindow(QWidget):
         else:
             self._do_pause()
 
+    @pyqtSlot()
     def reset(self) -> None:
         self._cd_timer.stop(); self._cd_val = None
-        self.scroll_y = 0.0; self.is_playing = False
+        self._set_scroll(0.0); self.is_playing = False
         self._last_fl = -1
         self._scroll_timer.stop()
         self._sync_touch_play()
@@ -507,26 +815,32 @@ class TeleprompterWindow(QWidget):
         else:
             eff = self.speed
 
-        self.scroll_y += (eff / 16.667) * dt_ms
+        delta = (eff / 16.667) * dt_ms
+        if delta < 0.005:
+            # Effectively idle (mic silence smoothed to ~0) — the frame would
+            # be pixel-identical, so skip layout checks, sync and repaint
+            return
+        self._scroll_q8 += int(delta * 256)
+        self.scroll_y    = self._scroll_q8 / 256.0
 
         # Ensure layout is current (cheap — cache check only)
         self._ensure_layout()
         lh    = self._f_line_h
         total = self._l_total
 
-        # PAUSE + notes check (only when focus line changes)
+        # PAUSE + notes check (only when focus line changes) — pure int math
         if lh > 0:
-            fl = int(self.scroll_y / lh)
+            fl = (self._scroll_q8 >> 8) // lh
             if fl != self._last_fl:
                 self._last_fl = fl
                 if fl in self._l_pause:
-                    self.scroll_y = float(fl * lh)
+                    self._set_scroll(float(fl * lh))
                     self._do_pause()
                     self.update(); return
                 self.notes_window.set_current(self._l_notes.get(fl))
 
         if self.scroll_y >= total:
-            self.scroll_y = total; self.is_playing = False
+            self._set_scroll(total); self.is_playing = False
             self._scroll_timer.stop(); self._sync_touch_play()
             if self._panel_sync: self._panel_sync()
 
@@ -537,13 +851,17 @@ class TeleprompterWindow(QWidget):
             if self._progress_sync: self._progress_sync(self.scroll_y, total)
             if self._wpm_sync:      self._wpm_sync(self._calc_wpm(total))
 
-        self.update()
+        # Invalidate only the band where text is actually visible — outside
+        # focus ± fade range the alpha is 0, so those pixels never change
+        band = _FADE_RANGE + lh
+        focus_y = int(self.height() * self.focus_ratio)
+        self.update(0, max(0, focus_y - band), self.width(), band * 2)
 
     # ── WPM estimate ──────────────────────────────────────────────────────────
     def _calc_wpm(self, total_px: float) -> int:
         if total_px <= 0: return 0
-        words = len([w for w in self.text.split() if w and '[' not in w])
-        return int((self.speed * 60.0 / 16.667 * 60) * (words / total_px))
+        return int((self.speed * 60.0 / 16.667 * 60)
+                   * (self._word_count / total_px))
 
     # ── Mic ───────────────────────────────────────────────────────────────────
     def start_mic(self):
@@ -551,10 +869,14 @@ class TeleprompterWindow(QWidget):
         try:
             thr = self.mic_threshold
             def cb(indata, *_):
-                rms = float(_np.sqrt(_np.mean(indata ** 2)))
+                # dot(x,x) avoids the indata**2 temporary; int16 halves the
+                # sample bandwidth (normalized back to [0,1) for the threshold)
+                x   = indata[:, 0].astype(_np.float64)
+                rms = (float(_np.dot(x, x)) / x.size) ** 0.5 / 32768.0
                 self._mic_target = self.speed if rms > thr else 0.0
             self._mic_stream = _sd.InputStream(
-                samplerate=16000, channels=1, blocksize=512, callback=cb)
+                samplerate=16000, channels=1, blocksize=1024,
+                dtype='int16', callback=cb)
             self._mic_stream.start()
         except Exception as exc:
             print(f"[Mic] {exc}")
@@ -600,44 +922,64 @@ class TeleprompterWindow(QWidget):
         # ── Ensure caches are current ──────────────────────────────────────────
         self._ensure_layout()
         lines   = self._l_lines
-        word_xs = self._l_word_xs
+        l_words = self._l_words
+        l_xs    = self._l_xs
+        line_xs = self._l_line_x
         pauses  = self._l_pause
         lh      = self._f_line_h
         asc     = self._f_asc
-        fm      = self._f_fm
         font    = self._f_font
-        align   = self.text_align
 
         painter.setFont(font)
 
         # Focus band
         painter.fillRect(0, focus_y - lh, W, lh * 2, self._c_focus_band)
 
-        # Focus line index + fractional position
-        frac       = self.scroll_y / lh if lh else 0.0
-        fl_idx     = int(frac)
-        fl_frac    = frac - fl_idx
+        # Focus line index + fractional position — integer divmod on the Q8
+        # counter instead of float division per frame
+        sy_px      = self._scroll_q8 >> 8
+        fl_idx, r  = divmod(sy_px, lh) if lh else (0, 0)
+        fl_frac    = r / lh if lh else 0.0
 
         if self.mirror_mode:
             painter.scale(-1, 1); painter.translate(-W, 0)
 
-        start_y    = focus_y - int(self.scroll_y)
+        start_y    = focus_y - sy_px
         # Compute visible range arithmetically — never loop over hidden lines
         first_i    = max(0, (-start_y - lh * 2) // lh)
         last_i     = min(len(lines), first_i + (H + lh * 4) // lh + 1)
 
-        # Cached ARGB components of text_color (avoid attribute lookup in loop)
-        tc_r = self.text_color.red()
-        tc_g = self.text_color.green()
-        tc_b = self.text_color.blue()
+        # Vectorized alpha for the whole visible slice — one C-loop instead of
+        # per-line Python math (scalar LUT fallback when numpy is absent)
+        if NUMBA_OK and last_i > first_i:
+            _, alphas = _line_visuals(first_i, last_i, start_y, lh, asc,
+                                      focus_y, _ALPHA_LUT_NP)
+        elif _np is not None and last_i > first_i:
+            dist_arr = _np.abs(
+                start_y + _np.arange(first_i, last_i) * lh + asc - focus_y)
+            _np.clip(dist_arr, None, 511, out=dist_arr)
+            alphas = _ALPHA_LUT_NP[dist_arr]
+        else:
+            alphas = None
+
+        # Pre-built alpha palettes (avoid QColor allocation in loop)
+        text_palette   = self._text_palette
+        shadow_palette = self._shadow_palette
 
+        # First pass: classify lines, bucketing plain text by alpha so the pen
+        # is set once per alpha value instead of twice per line. Pause markers
+        # and the highlighted focus line keep the direct path.
+        buckets : dict[int, list[int]] = {}
         for i in range(first_i, last_i):
             line = lines[i]
             y    = start_y + i * lh
             ay   = y + asc            # baseline y
 
-            dist  = abs(ay - focus_y)
-            alpha = _ALPHA_LUT[min(dist, 511)]   # O(1) LUT lookup
+            if alphas is not None:
+                alpha = int(alphas[i - first_i])
+            else:
+                dist  = abs(ay - focus_y)
+                alpha = _ALPHA_LUT[min(dist, 511)]   # O(1) LUT lookup
 
             if alpha < 8:
                 continue              # fully transparent — skip draw
@@ -645,45 +987,53 @@ class TeleprompterWindow(QWidget):
             # ── PAUSE marker ───────────────────────────────────────────────────
             if i in pauses:
                 mid = y + lh // 2
-                painter.setPen(QPen(QColor(255, 140, 0, alpha), 1, Qt.DashLine))
+                painter.setPen(self._pause_pens[alpha])
                 painter.drawLine(60, mid, W - 60, mid)
                 if alpha > 30:
-                    painter.setPen(QColor(255, 165, 0, alpha))
+                    painter.setPen(self._pause_palette[alpha])
                     painter.setFont(QFont(self.font_family, 14))
                     painter.drawText(W // 2 - 38, mid + 7, "⏸  PAUSE")
                     painter.setFont(font)
                 continue
 
-            # ── Normal line ────────────────────────────────────────────────────
-            # Shadow (pre-alpha'd, one draw call for whole line)
-            shad_alpha = min(255, alpha >> 1)     # alpha / 2
-            painter.setPen(QColor(0, 0, 0, shad_alpha))
-            lw   = fm.horizontalAdvance(line)
-            lx   = _line_x(lw, align, W)
-            painter.drawText(lx + 1, ay + 2, line)
-
-            at_focus = (i == fl_idx)
-
-            if self.word_highlight and at_focus and word_xs[i]:
-                # Word-highlight path — positions already cached
-                wxl  = word_xs[i]
-                n    = len(wxl)
-                whi  = min(int(fl_frac * n), n - 1)
-                for wi, (word, wx) in enumerate(wxl):
+            if not line:
+                continue              # blank paragraph — nothing to draw
+
+            if self.word_highlight and i == fl_idx and l_words[i]:
+                # Word-highlight path — positions already cached (SoA)
+                painter.setPen(shadow_palette[alpha >> 1])
+                painter.drawText(line_xs[i] + 1, ay + 2, line)
+                words = l_words[i]
+                xs    = l_xs[i]
+                n     = len(words)
+                whi   = min(int(fl_frac * n), n - 1)
+                for wi in range(n):
+                    word = words[wi]
+                    wx   = int(xs[wi])
                     if wi == whi:
                         # Extra glow shadow
-                        painter.setPen(QColor(0, 0, 0, 180))
+                        painter.setPen(shadow_palette[180])
                         painter.drawText(wx + 2, ay + 2, word)
-                        c = QColor(self._c_highlight); c.setAlpha(alpha)
+                        painter.setPen(self._hl_palette[alpha])
                     else:
-                        c = QColor(tc_r, tc_g, tc_b, alpha)
-                    painter.setPen(c)
+                        painter.setPen(text_palette[alpha])
                     painter.drawText(wx, ay, word)
             else:
-                # Fast path: single drawText for whole line
-                c = QColor(tc_r, tc_g, tc_b, alpha)
-                painter.setPen(c)
-                painter.drawText(lx, ay, line)
+                bucket = buckets.get(alpha)
+                if bucket is None:
+                    bucket = buckets[alpha] = []
+                bucket.append(i)
+
+        # Batched passes: shadows, then text — one pen change per alpha bucket
+        base_y = start_y + asc
+        for alpha, idxs in buckets.items():
+            painter.setPen(shadow_palette[alpha >> 1])
+            for i in idxs:
+                painter.drawText(line_xs[i] + 1, base_y + i * lh + 2, lines[i])
+        for alpha, idxs in buckets.items():
+            painter.setPen(text_palette[alpha])
+            for i in idxs:
+                painter.drawText(line_xs[i], base_y + i * lh, lines[i])
 
         # Guide lines (cached QColor)
         painter.setPen(QPen(self._c_guide, 1))
@@ -696,8 +1046,8 @@ class TeleprompterWindow(QWidget):
         if   k in (Qt.Key_Space, Qt.Key_Return): self.toggle_play()
         elif k == Qt.Key_Up:    self._speed_up()
         elif k == Qt.Key_Down:  self._speed_dn()
-        elif k == Qt.Key_Left:  self.scroll_y = max(0.0, self.scroll_y - 80); self.update()
-        elif k == Qt.Key_Right: self.scroll_y += 80; self.update()
+        elif k == Qt.Key_Left:  self._set_scroll(max(0.0, self.scroll_y - 80)); self.update()
+        elif k == Qt.Key_Right: self._set_scroll(self.scroll_y + 80); self.update()
         elif k in (Qt.Key_R, Qt.Key_Escape): self.reset()
 
     def wheelEvent(self, e):
@@ -749,13 +1099,56 @@ class ControlPanel(QWidget):
         self._debounce.setSingleShot(True)
         self._debounce.setInterval(280)
         self._debounce.timeout.connect(self._flush_text)
+        self._text_dirty       : bool = False
+        self._last_pushed_text : str | None = None
+
+        # Precomputed WPM color-band stylesheets — _sync_wpm runs ~7.5×/s and
+        # Qt reparses every stylesheet it is handed, so only band transitions
+        # may touch setStyleSheet
+        _wpm_cols = ("#aaa", "#2ecc71", "#f39c12", "#e74c3c")
+        self._wpm_big_styles = [f"color:{c};" for c in _wpm_cols]
+        self._wpm_lbl_styles = [
+            f"color:{c};font-size:12px;font-weight:bold;" for c in _wpm_cols]
+        self._last_wpm_band  = -1
+
+        # Progress coalescer: emissions only stash the latest values; the
+        # widgets are touched at most once per interval
+        self._pending_prog : tuple | None = None
+        self._last_permille  : int = -1
+        self._last_time_text : str = ""
+        self._prog_timer = QTimer(self)
+        self._prog_timer.setSingleShot(True)
+        self._prog_timer.setInterval(130)
+        self._prog_timer.timeout.connect(self._flush_progress)
+
+        # Shared debounce for the expensive display sliders: dragging updates
+        # only the value labels; the relayout runs once the drag pauses
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(100)
+        self._slider_debounce.timeout.connect(self._apply_slider_settings)
+
+        self._wpm_big : QLabel | None = None   # created when the Mic tab builds
 
         self._build_ui()
         self._restore_autosave()
         self._setup_global_hotkeys()
+        # Default-on; normally done by the Display tab, which is now lazy
+        prompter.set_touch_controls(True)
+
+    def _on_text_changed(self):
+        self._text_dirty = True
+        self._debounce.start()
 
     def _flush_text(self):
-        self.prompter.set_text(self._editor.toPlainText())
+        if not self._text_dirty:
+            return
+        self._text_dirty = False
+        t = self._editor.toPlainText()
+        if t == self._last_pushed_text:
+            return   # content unchanged — skip the full relayout
+        self._last_pushed_text = t
+        self.prompter.set_text(t)
 
     # ── UI ────────────────────────────────────────────────────────────────────
     def _build_ui(self):
@@ -769,9 +1162,16 @@ class ControlPanel(QWidget):
         tabs = QTabWidget()
         tabs.addTab(self._tab_script(),   "📝  Script")
         tabs.addTab(self._tab_playback(), "▶  Playback")
-        tabs.addTab(self._tab_display(),  "🖥  Display")
-        tabs.addTab(self._tab_mic(),      "🎙  Mic / WPM")
-        tabs.addTab(self._tab_advanced(), "⚙  Advanced")
+        # Remaining tabs are built on first activation — the Display tab's
+        # QFontComboBox alone enumerates every installed font, which can cost
+        # hundreds of ms on the startup path
+        self._tabs = tabs
+        self._lazy_tabs = {
+            tabs.addTab(QWidget(), "🖥  Display"):   self._tab_display,
+            tabs.addTab(QWidget(), "🎙  Mic / WPM"): self._tab_mic,
+            tabs.addTab(QWidget(), "⚙  Advanced"):   self._tab_advanced,
+        }
+        tabs.currentChanged.connect(self._build_lazy_tab)
         root.addWidget(tabs)
 
         pg = QGroupBox("Progress"); pl = QVBoxLayout(pg)
@@ -795,6 +1195,32 @@ class ControlPanel(QWidget):
         hint.setAlignment(Qt.AlignCenter)
         hint.setStyleSheet("color:#555;font-size:10px;"); root.addWidget(hint)
 
+    def _make_slider(self, lo: int, hi: int, init: int, lbl_text: str,
+                     lbl_w: int, on_change, on_release=None):
+        """Slider + value label, wired to bound methods (no lambda closures)."""
+        sl = QSlider(Qt.Horizontal)
+        sl.setRange(lo, hi); sl.setValue(init)
+        sl.valueChanged.connect(on_change)
+        if on_release is not None:
+            sl.sliderReleased.connect(on_release)
+        lbl = QLabel(lbl_text); lbl.setFixedWidth(lbl_w)
+        return sl, lbl
+
+    def _build_lazy_tab(self, idx: int):
+        builder = self._lazy_tabs.pop(idx, None)   # pop — build exactly once
+        if builder is None: return
+        label = self._tabs.tabText(idx)
+        # removeTab re-emits currentChanged for the placeholder that shifts
+        # into this slot, cascading into building every earlier lazy tab —
+        # block signals around the swap (nothing else listens to them)
+        self._tabs.blockSignals(True)
+        try:
+            self._tabs.removeTab(idx)
+            self._tabs.insertTab(idx, builder(), label)
+            self._tabs.setCurrentIndex(idx)
+        finally:
+            self._tabs.blockSignals(False)
+
     # ── Tab: Script ───────────────────────────────────────────────────────────
     def _tab_script(self):
         w = QWidget(); vl = QVBoxLayout(w)
@@ -809,7 +1235,9 @@ class ControlPanel(QWidget):
             sr.addWidget(b)
         vl.addLayout(sr)
 
-        self._editor = QTextEdit()
+        # QPlainTextEdit: lazy block layout + fixed line spacing — much lighter
+        # than QTextEdit's rich-text document engine on long scripts
+        self._editor = QPlainTextEdit()
         self._editor.setPlaceholderText(
             "Type your script here…\n\n"
             "Special tags:\n"
@@ -819,7 +1247,7 @@ class ControlPanel(QWidget):
         self._editor.setMinimumHeight(180)
         self._editor.setUndoRedoEnabled(True)
         # Debounced: don't re-layout on every keystroke
-        self._editor.textChanged.connect(self._debounce.start)
+        self._editor.textChanged.connect(self._on_text_changed)
         vl.addWidget(self._editor)
 
         br = QHBoxLayout()
@@ -853,10 +1281,8 @@ class ControlPanel(QWidget):
         g = QGroupBox("Settings"); gl = QGridLayout(g); gl.setColumnStretch(1, 1)
 
         gl.addWidget(QLabel("Scroll Speed:"), 0, 0)
-        self._speed_sl = QSlider(Qt.Horizontal)
-        self._speed_sl.setRange(1, 40); self._speed_sl.setValue(4)
-        self._speed_sl.valueChanged.connect(self._on_speed)
-        self._speed_lbl = QLabel("2.0 px/fr"); self._speed_lbl.setFixedWidth(72)
+        self._speed_sl, self._speed_lbl = self._make_slider(
+            1, 40, 4, "2.0 px/fr", 72, self._on_speed)
         gl.addWidget(self._speed_sl, 0, 1); gl.addWidget(self._speed_lbl, 0, 2)
 
         gl.addWidget(QLabel("Countdown (sec):"), 1, 0)
@@ -892,8 +1318,11 @@ class ControlPanel(QWidget):
             g.addWidget(widget, r, 1, 1, span); r += 1
 
         # Theme
+        # One-shot QStringListModel instead of addItems — a single model set
+        # rather than one insert + dataChanged notification per entry
         self._theme_cb = QComboBox()
-        self._theme_cb.addItems(list(THEMES))
+        self._theme_model = QStringListModel(list(THEMES))
+        self._theme_cb.setModel(self._theme_model)
         self._theme_cb.currentTextChanged.connect(self._apply_theme)
         add_row("Theme:", self._theme_cb)
 
@@ -906,32 +1335,27 @@ class ControlPanel(QWidget):
         add_row("Font:", self._font_cb)
 
         # Font size
-        self._font_sl = QSlider(Qt.Horizontal)
-        self._font_sl.setRange(16, 120); self._font_sl.setValue(48)
-        self._font_sl.valueChanged.connect(self._on_font)
-        self._font_lbl = QLabel("48 pt"); self._font_lbl.setFixedWidth(52)
+        self._font_sl, self._font_lbl = self._make_slider(
+            16, 120, 48, "48 pt", 52, self._on_font, self._commit_sliders)
         g.addWidget(QLabel("Font Size:"), r, 0)
         g.addWidget(self._font_sl, r, 1); g.addWidget(self._font_lbl, r, 2); r += 1
 
         # Line spacing
-        self._ls_sl = QSlider(Qt.Horizontal)
-        self._ls_sl.setRange(10, 30); self._ls_sl.setValue(12)
-        self._ls_sl.valueChanged.connect(self._on_ls)
-        self._ls_lbl = QLabel("1.2×"); self._ls_lbl.setFixedWidth(52)
+        self._ls_sl, self._ls_lbl = self._make_slider(
+            10, 30, 12, "1.2×", 52, self._on_ls, self._commit_sliders)
         g.addWidget(QLabel("Line Spacing:"), r, 0)
         g.addWidget(self._ls_sl, r, 1); g.addWidget(self._ls_lbl, r, 2); r += 1
 
         # Text alignment
         self._align_cb = QComboBox()
-        self._align_cb.addItems(["Left", "Center", "Right"])
+        self._align_model = QStringListModel(["Left", "Center", "Right"])
+        self._align_cb.setModel(self._align_model)
         self._align_cb.currentIndexChanged.connect(self._on_align)
         add_row("Text Align:", self._align_cb)
 
         # BG opacity
-        self._opa_sl = QSlider(Qt.Horizontal)
-        self._opa_sl.setRange(0, 95); self._opa_sl.setValue(70)
-        self._opa_sl.valueChanged.connect(self._on_opacity)
-        self._opa_lbl = QLabel("70 %"); self._opa_lbl.setFixedWidth(52)
+        self._opa_sl, self._opa_lbl = self._make_slider(
+            0, 95, 70, "70 %", 52, self._on_opacity, self._commit_sliders)
         g.addWidget(QLabel("BG Opacity:"), r, 0)
         g.addWidget(self._opa_sl, r, 1); g.addWidget(self._opa_lbl, r, 2); r += 1
 
@@ -948,7 +1372,9 @@ class ControlPanel(QWidget):
 
         # Focus zone
         self._focus_cb = QComboBox()
-        self._focus_cb.addItems(["Top (25%)", "Center (50%)", "Bottom (75%)"])
+        self._focus_model = QStringListModel(
+            ["Top (25%)", "Center (50%)", "Bottom (75%)"])
+        self._focus_cb.setModel(self._focus_model)
         self._focus_cb.setCurrentIndex(1)
         self._focus_cb.currentIndexChanged.connect(
             lambda i: (setattr(self.prompter, 'focus_ratio', [0.25, 0.50, 0.75][i]),
@@ -980,6 +1406,7 @@ class ControlPanel(QWidget):
         w = QWidget(); vl = QVBoxLayout(w)
 
         wg = QGroupBox("📊  WPM Tracker"); wl = QVBoxLayout(wg)
+        self._last_wpm_band = -1           # restyle both labels on next tick
         self._wpm_big = QLabel("—")
         self._wpm_big.setFont(QFont("Arial", 38, QFont.Bold))
         self._wpm_big.setAlignment(Qt.AlignCenter)
@@ -995,12 +1422,8 @@ class ControlPanel(QWidget):
             self._mic_ck.toggled.connect(self._on_mic)
             ml.addWidget(self._mic_ck)
             tr = QHBoxLayout(); tr.addWidget(QLabel("Sensitivity:"))
-            self._thr_sl = QSlider(Qt.Horizontal)
-            self._thr_sl.setRange(1, 20); self._thr_sl.setValue(5)
-            self._thr_lbl = QLabel("0.025"); self._thr_lbl.setFixedWidth(46)
-            self._thr_sl.valueChanged.connect(
-                lambda v: (setattr(self.prompter, 'mic_threshold', v / 200.0),
-                           self._thr_lbl.setText(f"{v/200:.3f}")))
+            self._thr_sl, self._thr_lbl = self._make_slider(
+                1, 20, 5, "0.025", 46, self._on_thr)
             tr.addWidget(self._thr_sl); tr.addWidget(self._thr_lbl)
             ml.addLayout(tr)
         else:
@@ -1053,16 +1476,25 @@ class ControlPanel(QWidget):
         return w
 
     # ── Slot helpers ──────────────────────────────────────────────────────────
+    def _save_async(self):
+        # Snapshot so the worker never races edits to the live dict
+        snap = {k: (dict(v) if isinstance(v, dict) else v)
+                for k, v in self._save_data.items()}
+        _SAVE_POOL.start(_SaveWorker(snap))
+
     def _refresh_slots(self):
+        # One C++ call + no per-item signal emission while repopulating
+        self._slot_cb.blockSignals(True)
         self._slot_cb.clear()
-        for n in self._save_data.get("slots", {}): self._slot_cb.addItem(n)
+        self._slot_cb.addItems(list(self._save_data.get("slots", {})))
+        self._slot_cb.blockSignals(False)
 
     def _save_slot(self):
         name, ok = QInputDialog.getText(self, "Save Slot", "Slot name:")
         if ok and name.strip():
             self._save_data.setdefault("slots", {})[name.strip()] = \
                 self._editor.toPlainText()
-            _write_save(self._save_data); self._refresh_slots()
+            self._save_async(); self._refresh_slots()
             idx = self._slot_cb.findText(name.strip())
             if idx >= 0: self._slot_cb.setCurrentIndex(idx)
 
@@ -1074,7 +1506,7 @@ class ControlPanel(QWidget):
         n = self._slot_cb.currentText()
         if n in self._save_data.get("slots", {}):
             del self._save_data["slots"][n]
-            _write_save(self._save_data); self._refresh_slots()
+            self._save_async(); self._refresh_slots()
 
     def _load_file(self):
         is_pymupdf = PYMUPDF_OK
@@ -1083,7 +1515,13 @@ class ControlPanel(QWidget):
                 "Text Files (*.txt);;All Files (*)")
         path, _ = QFileDialog.getOpenFileName(self, "Load Script", "", filt)
         if not path: return
-        text, err = _read_text_file(path)
+        worker = _LoadWorker(path)
+        worker.signals.done.connect(self._on_file_loaded)
+        self._load_worker = worker          # keep the signal holder alive
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_file_loaded(self, text: str, err):
+        self._load_worker = None
         if err:
             QMessageBox.warning(self, "Load Error", err); return
         self._editor.setPlainText(text)
@@ -1094,14 +1532,20 @@ class ControlPanel(QWidget):
             self._editor.blockSignals(True)
             self._editor.setPlainText(last)
             self._editor.blockSignals(False)
+            self._last_pushed_text = last
             self.prompter.set_text(last)
 
     # ── Global hotkeys ────────────────────────────────────────────────────────
     def _setup_global_hotkeys(self):
         if not HOTKEY_OK: return
+        # The keyboard library fires callbacks on its own thread; Qt widgets
+        # are not thread-safe, so marshal onto the UI thread via queued slots
+        def _queued(slot_name: str):
+            return lambda: QMetaObject.invokeMethod(
+                self.prompter, slot_name, Qt.QueuedConnection)
         try:
-            _kb.add_hotkey("space", self.prompter.toggle_play, suppress=False)
-            _kb.add_hotkey("r",     self.prompter.reset,       suppress=False)
+            _kb.add_hotkey("space", _queued("toggle_play"), suppress=False)
+            _kb.add_hotkey("r",     _queued("reset"),       suppress=False)
         except Exception:
             pass
 
@@ -1124,18 +1568,38 @@ class ControlPanel(QWidget):
         self._speed_lbl.setText(f"{p.speed:.1f} px/fr")
 
     def _sync_progress(self, sy: float, total: float):
+        self._pending_prog = (sy, total)
+        if not self._prog_timer.isActive():
+            self._prog_timer.start()
+
+    def _flush_progress(self):
+        if self._pending_prog is None: return
+        sy, total = self._pending_prog
+        self._pending_prog = None
         if total <= 0: return
-        self._prog.setValue(int(min(sy / total, 1.0) * 1000))
+        # Only touch the widgets when the displayed value actually changes —
+        # setText re-shapes the string and setValue repaints the bar
+        permille = int(min(sy / total, 1.0) * 1000)
+        if permille != self._last_permille:
+            self._last_permille = permille
+            self._prog.setValue(permille)
         secs  = (total - sy) / (self.prompter.speed * 60.0) if self.prompter.speed else 0
         m, s  = divmod(int(secs), 60)
-        self._time_lbl.setText(f"Time remaining: {m}:{s:02d}")
+        txt   = f"Time remaining: {m}:{s:02d}"
+        if txt != self._last_time_text:
+            self._last_time_text = txt
+            self._time_lbl.setText(txt)
 
     def _sync_wpm(self, wpm: int):
-        self._wpm_big.setText(str(wpm)); self._wpm_lbl.setText(f"WPM: {wpm}")
-        col = ("#aaa" if wpm < 100 else "#2ecc71" if wpm < 200
-               else "#f39c12" if wpm < 280 else "#e74c3c")
-        self._wpm_big.setStyleSheet(f"color:{col};")
-        self._wpm_lbl.setStyleSheet(f"color:{col};font-size:12px;font-weight:bold;")
+        self._wpm_lbl.setText(f"WPM: {wpm}")
+        if self._wpm_big is not None:      # Mic tab may not be built yet
+            self._wpm_big.setText(str(wpm))
+        band = 0 if wpm < 100 else 1 if wpm < 200 else 2 if wpm < 280 else 3
+        if band != self._last_wpm_band:
+            self._last_wpm_band = band
+            self._wpm_lbl.setStyleSheet(self._wpm_lbl_styles[band])
+            if self._wpm_big is not None:
+                self._wpm_big.setStyleSheet(self._wpm_big_styles[band])
 
     # ── Setting slots ─────────────────────────────────────────────────────────
     def _on_speed(self, v):
@@ -1143,16 +1607,29 @@ class ControlPanel(QWidget):
         self._speed_lbl.setText(f"{s:.1f} px/fr")
 
     def _on_font(self, v):
-        self.prompter.font_size = v; self._font_lbl.setText(f"{v} pt")
-        self.prompter.invalidate_layout()
+        self._font_lbl.setText(f"{v} pt"); self._slider_debounce.start()
 
     def _on_ls(self, v):
-        f = v / 10.0; self.prompter.line_spacing_factor = f
-        self._ls_lbl.setText(f"{f:.1f}×"); self.prompter.invalidate_layout()
+        self._ls_lbl.setText(f"{v / 10.0:.1f}×"); self._slider_debounce.start()
 
     def _on_opacity(self, v):
-        self.prompter.bg_opacity = v / 100.0; self._opa_lbl.setText(f"{v} %")
-        self.prompter._rebuild_color_cache(); self.prompter.update()
+        self._opa_lbl.setText(f"{v} %"); self._slider_debounce.start()
+
+    def _on_thr(self, v):
+        self.prompter.mic_threshold = v / 200.0
+        self._thr_lbl.setText(f"{v / 200:.3f}")
+
+    def _commit_sliders(self):
+        # Mouse released — apply immediately instead of waiting out the timer
+        self._slider_debounce.stop()
+        self._apply_slider_settings()
+
+    def _apply_slider_settings(self):
+        p = self.prompter
+        p.font_size           = self._font_sl.value()
+        p.line_spacing_factor = self._ls_sl.value() / 10.0
+        p.bg_opacity          = self._opa_sl.value() / 100.0
+        p.invalidate_layout()   # rebuilds color cache + repaints once
 
     def _on_align(self, idx):
         self.prompter.text_align = [Qt.AlignLeft, Qt.AlignHCenter, Qt.AlignRight][idx]
@@ -1166,21 +1643,27 @@ class ControlPanel(QWidget):
         if name not in THEMES: return
         t = THEMES[name]
         bg, tx = QColor(*t["bg"]), QColor(*t["text"])
-        self.prompter.bg_color   = bg
-        self.prompter.text_color = tx
-        self.prompter.bg_opacity = t["opacity"]
-        self._apply_color_btn(self._bg_col_btn,  bg)
-        self._apply_color_btn(self._txt_col_btn, tx)
-        v = int(t["opacity"] * 100)
-        self._opa_sl.blockSignals(True); self._opa_sl.setValue(v)
-        self._opa_sl.blockSignals(False); self._opa_lbl.setText(f"{v} %")
-        self.prompter._rebuild_color_cache(); self.prompter.update()
+        p = self.prompter
+        p._suspend_updates = True   # batch the compound change → one repaint
+        try:
+            p.bg_color   = bg
+            p.text_color = tx
+            p.bg_opacity = t["opacity"]
+            self._apply_color_btn(self._bg_col_btn,  bg)
+            self._apply_color_btn(self._txt_col_btn, tx)
+            v = int(t["opacity"] * 100)
+            self._opa_sl.blockSignals(True); self._opa_sl.setValue(v)
+            self._opa_sl.blockSignals(False); self._opa_lbl.setText(f"{v} %")
+        finally:
+            p._suspend_updates = False
+        p._rebuild_color_cache(); p.update()
 
     def _pick_text_color(self):
         c = QColorDialog.getColor(self.prompter.text_color, self, "Text Color")
         if c.isValid():
             self.prompter.text_color = c
-            self._apply_color_btn(self._txt_col_btn, c); self.prompter.update()
+            self._apply_color_btn(self._txt_col_btn, c)
+            self.prompter._rebuild_color_cache(); self.prompter.update()
 
     def _pick_bg_color(self):
         c = QColorDialog.getColor(self.prompter.bg_color, self, "Background Color")
@@ -1195,63 +1678,19 @@ class ControlPanel(QWidget):
         path, _ = QFileDialog.getSaveFileName(
             self, "Export as PDF", "script.pdf", "PDF Files (*.pdf)")
         if not path: return
-
-        printer = QPrinter(QPrinter.HighResolution)
-        printer.setOutputFormat(QPrinter.PdfFormat)
-        printer.setOutputFileName(path)
-        pnt = QPainter()
-        if not pnt.begin(printer):
-            QMessageBox.warning(self, "Export Failed", "Could not create PDF."); return
-
-        PW, PH  = printer.width(), printer.height()
-        marg    = int(PW * 0.09)
-        mw      = PW - 2 * marg
-        bf      = QFont("Arial", 36); bfm = QFontMetrics(bf); lh = bfm.lineSpacing() + 10
-        tf      = QFont("Arial", 52, QFont.Bold); tfm = QFontMetrics(tf)
-        y       = marg
-
-        pnt.setFont(tf); pnt.setPen(QColor(30, 30, 30))
-        pnt.drawText(marg, y + tfm.ascent(), "Script")
-        y += tfm.lineSpacing() + lh // 2
-        pnt.setPen(QPen(QColor(120, 120, 120), 2))
-        pnt.drawLine(marg, y, PW - marg, y); y += lh
-
-        pnt.setFont(bf); sp_w = bfm.horizontalAdvance(' ')
-        clean = _NOTE_RE.sub('', self._editor.toPlainText())
-
-        for raw in clean.split('\n'):
-            para = raw.strip()
-            if not para:
-                y += lh // 2; continue
-            if y + lh * 2 > PH - marg: printer.newPage(); y = marg
-
-            if para == _PAUSE_TAG:
-                mid = y + lh // 2
-                pnt.setPen(QPen(QColor(200, 100, 0), 1, Qt.DashLine))
-                pnt.drawLine(marg, mid, PW - marg, mid)
-                pf = QFont("Arial", 24); pfm = QFontMetrics(pf)
-                pnt.setFont(pf); pnt.setPen(QColor(200, 100, 0))
-                pnt.drawText(PW // 2 - 38, mid + pfm.ascent() // 2, "⏸ PAUSE")
-                pnt.setFont(bf); y += lh; continue
-
-            cur_w, cur = 0, []
-            for word in para.split():
-                ww = bfm.horizontalAdvance(word)
-                needed = ww if not cur else sp_w + ww
-                if cur_w + needed <= mw:
-                    cur.append(word); cur_w += needed
-                else:
-                    if cur:
-                        if y + lh > PH - marg: printer.newPage(); y = marg
-                        pnt.setPen(QColor(20, 20, 20))
-                        pnt.drawText(marg, y + bfm.ascent(), ' '.join(cur)); y += lh
-                    cur, cur_w = [word], ww
-            if cur:
-                if y + lh > PH - marg: printer.newPage(); y = marg
-                pnt.drawText(marg, y + bfm.ascent(), ' '.join(cur)); y += lh
-
-        pnt.end()
-        QMessageBox.information(self, "Export Complete", f"Saved:\n{path}")
+        # Rendering a long script can take seconds — run it on the pool so
+        # the panel (and playback) stay responsive
+        worker = _ExportWorker(path, self._editor.toPlainText())
+        worker.signals.done.connect(self._on_export_done)
+        self._export_worker = worker       # keep the signal holder alive
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_done(self, path: str, err):
+        self._export_worker = None
+        if err:
+            QMessageBox.warning(self, "Export Failed", err)
+        else:
+            QMessageBox.information(self, "Export Complete", f"Saved:\n{path}")
 
     # ── Style helpers ─────────────────────────────────────────────────────────
     @staticmethod
@@ -1274,6 +1713,10 @@ class ControlPanel(QWidget):
     def closeEvent(self, event):
         self._debounce.stop()
         self._save_data["last_text"] = self._editor.toPlainText()
+        # Synchronous on purpose — the thread pool may be torn down with the
+        # app, and the final write must land before we exit. Drain any
+        # in-flight worker first so it cannot race this write.
+        _SAVE_POOL.waitForDone()
         _write_save(self._save_data)
         self.prompter.stop_mic()
         if HOTKEY_OK:
@@ -1295,61 +1738,78 @@ def _make_icon():
       • Three horizontal text lines (scroll metaphor)
       • Amber focus band across the middle line
       • Small green play-triangle in the bottom-right corner
+
+    Rendered at several sizes so the icon engine picks an exact match for
+    taskbar / titlebar requests instead of rescaling the 256 px master.
     """
-    from PyQt5.QtGui import QPixmap, QIcon, QBrush, QLinearGradient, QPolygon
+    from PyQt5.QtGui import (
+        QImage, QPixmap, QIcon, QBrush, QLinearGradient, QPolygon,
+    )
     from PyQt5.QtCore import QPoint
-    sz = 256
-    px = QPixmap(sz, sz)
-    px.fill(Qt.transparent)
-    p  = QPainter(px)
-    p.setRenderHint(QPainter.Antialiasing)
-
-    # Background
-    bg = QLinearGradient(0, 0, 0, sz)
-    bg.setColorAt(0, QColor(28, 28, 40))
-    bg.setColorAt(1, QColor(12, 12, 22))
-    p.setBrush(QBrush(bg)); p.setPen(Qt.NoPen)
-    p.drawRoundedRect(4, 4, sz - 8, sz - 8, 36, 36)
-
-    # Border glow
-    p.setPen(QPen(QColor(80, 160, 255, 55), 3))
-    p.setBrush(Qt.NoBrush)
-    p.drawRoundedRect(4, 4, sz - 8, sz - 8, 36, 36)
-
-    # Three lines
-    lx, lw, lh, r = 38, sz - 76, 18, 6
-    ys = [82, 128, 174]
-
-    # Focus band behind middle line
-    p.setBrush(QColor(255, 200, 60, 38)); p.setPen(Qt.NoPen)
-    p.drawRoundedRect(lx - 6, ys[1] - 4, lw + 12, lh + 8, 5, 5)
-
-    for i, y in enumerate(ys):
-        p.setPen(Qt.NoPen)
-        if i == 1:
-            g2 = QLinearGradient(lx, y, lx + lw, y)
-            g2.setColorAt(0.0, QColor(255, 225, 80, 230))
-            g2.setColorAt(1.0, QColor(255, 190, 30, 180))
-            p.setBrush(QBrush(g2))
-            w = lw
-        else:
-            p.setBrush(QColor(200, 200, 220, 110 if i == 0 else 75))
-            w = int(lw * (0.72 if i == 0 else 0.55))
-        p.drawRoundedRect(lx, y, w, lh, r, r)
-
-    # Guide lines
-    p.setPen(QPen(QColor(255, 200, 60, 115), 2))
-    for dy in (-4, lh + 8):
-        p.drawLine(lx - 10, ys[1] + dy, lx + lw + 10, ys[1] + dy)
-
-    # Play triangle (bottom-right)
-    tx, ty, ts = sz - 62, sz - 62, 34
-    tri = QPolygon([QPoint(tx, ty + ts), QPoint(tx, ty), QPoint(tx + ts, ty + ts // 2)])
-    p.setBrush(QColor(52, 199, 89, 215)); p.setPen(Qt.NoPen)
-    p.drawPolygon(tri)
-
-    p.end()
-    return QIcon(px)
+    base = 256
+
+    def render(size: int) -> 'QImage':
+        # QImage rather than QPixmap: premultiplied ARGB composites cheaper,
+        # and rendering is thread-safe / headless-safe (no window system tie)
+        img = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        img.fill(Qt.transparent)
+        p  = QPainter(img)
+        p.setRenderHint(QPainter.Antialiasing)
+        if size != base:
+            p.scale(size / base, size / base)   # draw in 256-space throughout
+
+        # Background
+        bg = QLinearGradient(0, 0, 0, base)
+        bg.setColorAt(0, QColor(28, 28, 40))
+        bg.setColorAt(1, QColor(12, 12, 22))
+        p.setBrush(QBrush(bg)); p.setPen(Qt.NoPen)
+        p.drawRoundedRect(4, 4, base - 8, base - 8, 36, 36)
+
+        # Border glow
+        p.setPen(QPen(QColor(80, 160, 255, 55), 3))
+        p.setBrush(Qt.NoBrush)
+        p.drawRoundedRect(4, 4, base - 8, base - 8, 36, 36)
+
+        # Three lines
+        lx, lw, lh, r = 38, base - 76, 18, 6
+        ys = [82, 128, 174]
+
+        # Focus band behind middle line
+        p.setBrush(QColor(255, 200, 60, 38)); p.setPen(Qt.NoPen)
+        p.drawRoundedRect(lx - 6, ys[1] - 4, lw + 12, lh + 8, 5, 5)
+
+        for i, y in enumerate(ys):
+            p.setPen(Qt.NoPen)
+            if i == 1:
+                g2 = QLinearGradient(lx, y, lx + lw, y)
+                g2.setColorAt(0.0, QColor(255, 225, 80, 230))
+                g2.setColorAt(1.0, QColor(255, 190, 30, 180))
+                p.setBrush(QBrush(g2))
+                w = lw
+            else:
+                p.setBrush(QColor(200, 200, 220, 110 if i == 0 else 75))
+                w = int(lw * (0.72 if i == 0 else 0.55))
+            p.drawRoundedRect(lx, y, w, lh, r, r)
+
+        # Guide lines
+        p.setPen(QPen(QColor(255, 200, 60, 115), 2))
+        for dy in (-4, lh + 8):
+            p.drawLine(lx - 10, ys[1] + dy, lx + lw + 10, ys[1] + dy)
+
+        # Play triangle (bottom-right)
+        tx, ty, ts = base - 62, base - 62, 34
+        tri = QPolygon([QPoint(tx, ty + ts), QPoint(tx, ty),
+                        QPoint(tx + ts, ty + ts // 2)])
+        p.setBrush(QColor(52, 199, 89, 215)); p.setPen(Qt.NoPen)
+        p.drawPolygon(tri)
+
+        p.end()
+        return img
+
+    icon = QIcon()
+    for size in (256, 64, 48, 32, 16):
+        icon.addPixmap(QPixmap.fromImage(render(size)))
+    return icon
 
 
 # ══════════════════════════════════════════════════════════════════════════════